@@ -7,11 +7,22 @@ import pytest
 from pytest_operator.plugin import OpsTest
 
 from . import architecture, juju_
-from .helpers import APPLICATION_DEFAULT_APP_NAME, get_application_name
+from .helpers import (
+    APPLICATION_DEFAULT_APP_NAME,
+    cleanup_connection_pools,
+    get_application_name,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def mysql_connection_pools():
+    """Close pooled MySQL connections at the end of the test session."""
+    yield
+    cleanup_connection_pools()
+
+
 @pytest.fixture
 def charm():
     # Return str instead of pathlib.Path since python-libjuju's model.deploy(), juju deploy, and
@@ -1,15 +1,18 @@
 # Copyright 2022 Canonical Ltd.
 # See LICENSE file for licensing details.
 
-import itertools
+import asyncio
+import hashlib
 import json
 import logging
-import pathlib
-import subprocess
-import tempfile
-from typing import Dict, List, Optional
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
+import kubernetes.client
+import kubernetes.config
+import kubernetes.stream
 import mysql.connector
+import mysql.connector.pooling
 import tenacity
 import yaml
 from juju.model import Model
@@ -22,9 +25,15 @@ from mysql.connector.errors import (
 )
 from pytest_operator.plugin import OpsTest
 
-from .connector import MySQLConnector
 from .juju_ import run_action
 
+try:
+    # libyaml parses large documents (e.g. juju show-unit dumps) several times faster than
+    # the pure-Python loader
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
+
 logger = logging.getLogger(__name__)
 
 CONTINUOUS_WRITES_DATABASE_NAME = "continuous_writes_database"
@@ -38,13 +47,104 @@ SERVER_CONFIG_USERNAME = "serverconfig"
 CONTAINER_NAME = "mysql-router"
 LOGROTATE_EXECUTOR_SERVICE = "logrotate_executor"
 
+# Pools of MySQL connections, keyed by a digest of the connection config, so that repeated
+# queries with the same config (e.g. in retry loops) reuse connections instead of paying the
+# TCP + auth handshake on every call
+_connection_pools: Dict[str, mysql.connector.pooling.MySQLConnectionPool] = {}
+
+
+def _get_connection_pool(
+    pool_size: int = 5, **config
+) -> mysql.connector.pooling.MySQLConnectionPool:
+    """Get (or lazily create) the connection pool for a MySQL connection config.
+
+    Args:
+        pool_size: The number of connections to keep in the pool
+        config: Keyword arguments for the mysql connector (host, user, password, ...)
+
+    Returns:
+        The connection pool for the config
+    """
+    key = hashlib.blake2b(
+        json.dumps({**config, "pool_size": pool_size}, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    if key not in _connection_pools:
+        _connection_pools[key] = mysql.connector.pooling.MySQLConnectionPool(
+            pool_name=f"pool_{key[:12]}", pool_size=pool_size, **config
+        )
+    return _connection_pools[key]
+
+
+def cleanup_connection_pools() -> None:
+    """Close all pooled MySQL connections and drop the pools."""
+    for pool in _connection_pools.values():
+        pool._remove_connections()
+    _connection_pools.clear()
+
+
+def _execute_queries(
+    unit_address: str,
+    username: str,
+    password: str,
+    queries: List[Union[str, Tuple[str, tuple]]],
+    commit: bool = False,
+    result_type: type = list,
+) -> List:
+    """Blocking implementation of execute_queries_against_unit."""
+    connection = _get_connection_pool(
+        host=unit_address, user=username, password=password, connection_timeout=10
+    ).get_connection()
+
+    try:
+        if any(isinstance(query, tuple) for query in queries):
+            # Parameterized (sql, params) statements run on a prepared cursor so the server
+            # caches the parse/plan for the pooled connection's session instead of re-parsing
+            # the statement on every call. Prepared statements can't be combined with
+            # multi-statement execution.
+            cursor = connection.cursor(prepared=True)
+
+            def _values():
+                for query in queries:
+                    sql, params = query if isinstance(query, tuple) else (query, ())
+                    cursor.execute(sql, params)
+                    if cursor.with_rows:
+                        for row in cursor:
+                            yield from row
+
+            output = result_type(_values())
+        else:
+            cursor = connection.cursor()
+
+            # Join the queries into one multi-statement execution so that the batch costs a
+            # single network round-trip instead of one per statement. Stream the rows straight
+            # into the requested container instead of materializing an intermediate list.
+            joined_queries = "; ".join(query.strip().rstrip(";") for query in queries)
+            output = result_type(
+                value
+                for result in cursor.execute(joined_queries, multi=True)
+                if result.with_rows
+                for row in result
+                for value in row
+            )
+
+        if commit:
+            connection.commit()
+
+        cursor.close()
+        return output
+    finally:
+        # returns the connection to the pool even if a query fails mid-batch—a leaked
+        # connection would permanently shrink the session-long pool until it is exhausted
+        connection.close()
+
 
 async def execute_queries_against_unit(
     unit_address: str,
     username: str,
     password: str,
-    queries: List[str],
+    queries: List[Union[str, Tuple[str, tuple]]],
     commit: bool = False,
+    result_type: type = list,
 ) -> List:
     """Execute given MySQL queries on a unit.
 
@@ -52,31 +152,19 @@ async def execute_queries_against_unit(
         unit_address: The public IP address of the unit to execute the queries on
         username: The MySQL username
         password: The MySQL password
-        queries: A list of queries to execute
+        queries: A list of queries to execute; a query may be a (sql, params) tuple to
+            run it as a prepared statement with bound parameters
         commit: A keyword arg indicating whether there are any writes queries
+        result_type: The container type to collect the queried values into
 
     Returns:
-        A list of rows that were potentially queried
+        The values from all queries, in query order, collected into result_type
     """
-    connection = mysql.connector.connect(
-        host=unit_address,
-        user=username,
-        password=password,
+    # run the blocking mysql.connector calls in a thread so that concurrent verifications
+    # (e.g. asyncio.gather across units) don't stall the event loop
+    return await asyncio.to_thread(
+        _execute_queries, unit_address, username, password, queries, commit, result_type
     )
-    cursor = connection.cursor()
-
-    for query in queries:
-        cursor.execute(query)
-
-    if commit:
-        connection.commit()
-
-    output = list(itertools.chain(*cursor.fetchall()))
-
-    cursor.close()
-    connection.close()
-
-    return output
 
 
 async def get_server_config_credentials(unit: Unit) -> Dict:
@@ -115,6 +203,31 @@ async def get_credentials(unit: Unit) -> Dict:
     return await run_action(unit, "get-credentials")
 
 
+# Short-lived cache for juju status/show-unit lookups—each lookup spawns a juju CLI
+# subprocess or a status RPC, and retry loops repeat the same lookup every attempt
+_STATUS_CACHE_TTL = 2  # seconds
+_status_cache: Dict[str, tuple] = {}
+
+
+async def _cached_juju_output(key: str, get_output: Callable[[], Awaitable]) -> Any:
+    """Return a recent cached result for a juju lookup, refreshing it if stale.
+
+    Args:
+        key: The cache key for the lookup
+        get_output: Coroutine factory that performs the actual lookup
+
+    Returns:
+        the (possibly cached) result of the lookup
+    """
+    cached = _status_cache.get(key)
+    if cached and time.monotonic() - cached[0] < _STATUS_CACHE_TTL:
+        return cached[1]
+
+    output = await get_output()
+    _status_cache[key] = (time.monotonic(), output)
+    return output
+
+
 async def get_unit_address(ops_test: OpsTest, unit_name: str) -> str:
     """Get unit IP address.
 
@@ -125,7 +238,9 @@ async def get_unit_address(ops_test: OpsTest, unit_name: str) -> str:
     Returns:
         IP address of the unit
     """
-    status = await ops_test.model.get_status()
+    status = await _cached_juju_output(
+        f"status-{ops_test.model.info.name}", ops_test.model.get_status
+    )
     return status["applications"][unit_name.split("/")[0]].units[unit_name]["address"]
 
 
@@ -204,6 +319,83 @@ async def get_process_pid(
         return None
 
 
+# Bound the number of concurrently launched subprocesses/exec streams so that
+# asyncio.gather fan-outs can't exhaust file handles
+_subprocess_semaphore = asyncio.Semaphore(16)
+
+# Kubernetes API client, created on first use so the kubeconfig is parsed once per test
+# session instead of once per exec call
+_kubernetes_core_v1_api: Optional[kubernetes.client.CoreV1Api] = None
+
+
+def _get_kubernetes_core_v1_api() -> kubernetes.client.CoreV1Api:
+    """Get (or lazily create) the Kubernetes core v1 API client."""
+    global _kubernetes_core_v1_api
+    if _kubernetes_core_v1_api is None:
+        kubernetes.config.load_kube_config()
+        _kubernetes_core_v1_api = kubernetes.client.CoreV1Api()
+    return _kubernetes_core_v1_api
+
+
+def _exec_in_pod(
+    namespace: str,
+    pod_name: str,
+    container_name: str,
+    command: List[str],
+    stdin: Optional[bytes] = None,
+) -> str:
+    """Execute a command in a pod container over the Kubernetes API.
+
+    Runs in-process over the Kubernetes exec websocket instead of spawning a kubectl
+    subprocess per call.
+
+    Args:
+        namespace: The namespace (model name) in which the pod runs
+        pod_name: The name of the pod
+        container_name: The container in which to execute the command
+        command: The command to execute
+        stdin: Optional bytes to send to the command's stdin
+
+    Returns:
+        the stdout of the command
+    """
+    api_stream = kubernetes.stream.stream(
+        _get_kubernetes_core_v1_api().connect_get_namespaced_pod_exec,
+        pod_name,
+        namespace,
+        container=container_name,
+        command=command,
+        stderr=True,
+        stdin=stdin is not None,
+        stdout=True,
+        tty=False,
+        _preload_content=False,
+    )
+
+    if stdin is not None:
+        api_stream.write_stdin(stdin.decode())
+
+    stdout = []
+    stderr = []
+    # overall deadline so a wedged exec websocket can't hang a test forever
+    deadline = time.monotonic() + 5 * 60
+    while api_stream.is_open():
+        assert (
+            time.monotonic() < deadline
+        ), f"timed out executing {command=} in {pod_name=}: {''.join(stderr)}"
+        api_stream.update(timeout=1)
+        if api_stream.peek_stdout():
+            stdout.append(api_stream.read_stdout())
+        if api_stream.peek_stderr():
+            stderr.append(api_stream.read_stderr())
+
+    return_code = api_stream.returncode
+    api_stream.close()
+    assert return_code == 0, f"failed to execute {command=} in {pod_name=}: {''.join(stderr)}"
+
+    return "".join(stdout)
+
+
 async def write_content_to_file_in_unit(
     ops_test: OpsTest, unit: Unit, path: str, content: str, container_name: str = CONTAINER_NAME
 ) -> None:
@@ -218,22 +410,19 @@ async def write_content_to_file_in_unit(
     """
     pod_name = unit.name.replace("/", "-")
 
-    with tempfile.NamedTemporaryFile(mode="w", dir=pathlib.Path.home()) as temp_file:
-        temp_file.write(content)
-        temp_file.flush()
-
-        subprocess.run(
-            [
-                "microk8s.kubectl",
-                "cp",
-                "-n",
-                ops_test.model.info.name,
-                "-c",
-                container_name,
-                temp_file.name,
-                f"{pod_name}:{path}",
-            ],
-            check=True,
+    # stream the content straight over the exec channel—no need to stage it on disk first
+    data = content.encode()
+
+    # head -c exits as soon as the expected number of bytes has been received, which
+    # cleanly terminates the exec stream
+    async with _subprocess_semaphore:
+        await asyncio.to_thread(
+            _exec_in_pod,
+            ops_test.model.info.name,
+            pod_name,
+            container_name,
+            ["sh", "-c", f"head -c {len(data)} > {path}"],
+            stdin=data,
         )
 
 
@@ -253,30 +442,13 @@ async def read_contents_from_file_in_unit(
     """
     pod_name = unit.name.replace("/", "-")
 
-    with tempfile.NamedTemporaryFile(mode="r+", dir=pathlib.Path.home()) as temp_file:
-        subprocess.run(
-            [
-                "microk8s.kubectl",
-                "cp",
-                "-n",
-                ops_test.model.info.name,
-                "-c",
-                container_name,
-                f"{pod_name}:{path}",
-                temp_file.name,
-            ],
-            check=True,
+    # the exec stream already returns the full contents—no need to bounce them through a
+    # local tempfile
+    async with _subprocess_semaphore:
+        return await asyncio.to_thread(
+            _exec_in_pod, ops_test.model.info.name, pod_name, container_name, ["cat", path]
         )
 
-        temp_file.seek(0)
-
-        contents = ""
-        for line in temp_file:
-            contents += line
-            contents += "\n"
-
-    return contents
-
 
 async def ls_la_in_unit(
     ops_test: OpsTest, unit_name: str, directory: str, container_name: str = CONTAINER_NAME
@@ -297,12 +469,13 @@ async def ls_la_in_unit(
     )
     assert return_code == 0
 
-    ls_output = output.split("\n")[1:]
+    ls_output = (raw_line.rstrip("\r\n") for raw_line in output.split("\n")[1:])
 
+    # rsplit(maxsplit=1) extracts the file name without tokenizing the whole line
     return [
-        line.strip("\r")
+        line
         for line in ls_output
-        if len(line.strip()) > 0 and line.split()[-1] not in [".", ".."]
+        if line.strip() and line.rsplit(maxsplit=1)[-1] not in (".", "..")
     ]
 
 
@@ -332,25 +505,22 @@ async def stop_running_flush_mysqlrouter_job(ops_test: OpsTest, unit_name: str)
         ops_test: The ops test object passed into every test case
         unit_name: The name of the unit to be tested
     """
-    # send KILL signal to log rotate process, which trigger shutdown process
-    await ops_test.juju(
+    # send KILL signal to the log rotate process and wait for it to stop in a single remote
+    # shell, instead of spawning one juju+pgrep subprocess per polling attempt; the script
+    # is passed as one argument so juju ssh hands it to the remote shell intact
+    stop_logrotate_command = (
+        'pkill -9 -f "logrotate -f /etc/logrotate.d/flush_mysqlrouter_logs"; '
+        "for i in $(seq 1 45); do pgrep -x logrotate >/dev/null || exit 0; sleep 2; done; "
+        "exit 1"
+    )
+    return_code, _, _ = await ops_test.juju(
         "ssh",
         "--container",
         CONTAINER_NAME,
         unit_name,
-        "pkill",
-        "-9",
-        "-f",
-        "logrotate -f /etc/logrotate.d/flush_mysqlrouter_logs",
+        stop_logrotate_command,
     )
-
-    # hold execution until process is stopped
-    for attempt in tenacity.Retrying(
-        reraise=True, stop=tenacity.stop_after_attempt(45), wait=tenacity.wait_fixed(2)
-    ):
-        with attempt:
-            if await get_process_pid(ops_test, unit_name, CONTAINER_NAME, "logrotate"):
-                raise Exception("Failed to stop the flush_mysql_logs logrotate process.")
+    assert return_code == 0, "Failed to stop the flush_mysql_logs logrotate process."
 
 
 async def rotate_mysqlrouter_logs(ops_test: OpsTest, unit_name: str) -> None:
@@ -362,13 +532,12 @@ async def rotate_mysqlrouter_logs(ops_test: OpsTest, unit_name: str) -> None:
     """
     pod_label = unit_name.replace("/", "-")
 
-    subprocess.run(
-        [
+    async with _subprocess_semaphore:
+        process = await asyncio.create_subprocess_exec(
             "microk8s.kubectl",
             "exec",
             "-n",
             ops_test.model.info.name,
-            "-it",
             pod_label,
             "--container",
             CONTAINER_NAME,
@@ -378,9 +547,11 @@ async def rotate_mysqlrouter_logs(ops_test: OpsTest, unit_name: str) -> None:
             "mysql",
             "-c",
             "logrotate -f -s /tmp/logrotate.status /etc/logrotate.d/flush_mysqlrouter_logs",
-        ],
-        check=True,
-    )
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await process.communicate()
+    assert process.returncode == 0, f"failed to rotate mysqlrouter logs on {unit_name=}: {stderr}"
 
 
 @tenacity.retry(stop=tenacity.stop_after_attempt(8), wait=tenacity.wait_fixed(15), reraise=True)
@@ -400,9 +571,18 @@ def is_connection_possible(credentials: Dict, **extra_opts) -> bool:
         **extra_opts,
     }
     try:
-        with MySQLConnector(config) as cursor:
+        # reuse pooled connections across retry attempts so that each attempt only pays
+        # for the round-trip of the SELECT, not a fresh TCP + auth handshake
+        connection = _get_connection_pool(pool_size=2, **config).get_connection()
+        try:
+            cursor = connection.cursor()
             cursor.execute("SELECT 1")
-            return cursor.fetchone()[0] == 1
+            result = cursor.fetchone()[0] == 1
+            cursor.close()
+            return result
+        finally:
+            # returns the connection to the pool
+            connection.close()
     except (DatabaseError, InterfaceError, OperationalError, ProgrammingError) as e:
         # Errors raised when the connection is not possible
         logger.error(e)
@@ -422,10 +602,14 @@ async def get_tls_ca(
     Returns:
         TLS CA or an empty string if there is no CA.
     """
-    raw_data = (await ops_test.juju("show-unit", unit_name))[1]
+    raw_data = (
+        await _cached_juju_output(
+            f"show-unit-{unit_name}", lambda: ops_test.juju("show-unit", unit_name)
+        )
+    )[1]
     if not raw_data:
         raise ValueError(f"no unit info could be grabbed for {unit_name}")
-    data = yaml.safe_load(raw_data)
+    data = yaml.load(raw_data, Loader=_YamlSafeLoader)
     # Filter the data based on the relation name.
     relation_data = [
         v for v in data[unit_name]["relation-info"] if v["endpoint"] == "certificates"
@@ -463,9 +647,9 @@ def get_application_name(ops_test: OpsTest, application_name_substring: str) ->
     Note: if multiple applications with the application name exist,
     the first one found will be returned.
     """
-    for application in ops_test.model.applications:
-        if application_name_substring == application:
-            return application
+    # model.applications is a dict keyed by application name—use membership instead of a scan
+    if application_name_substring in ops_test.model.applications:
+        return application_name_substring
 
     return ""
 
@@ -487,19 +671,30 @@ async def get_primary_unit(
     Returns:
         A juju unit that is a MySQL primary
     """
-    units = ops_test.model.applications[app_name].units
+    units_by_name = {unit.name: unit for unit in ops_test.model.applications[app_name].units}
     results = await run_action(unit, "get-cluster-status")
 
-    primary_unit = None
     for k, v in results["status"]["defaultreplicaset"]["topology"].items():
         if v["memberrole"] == "primary":
-            unit_name = f"{app_name}/{k.split('-')[-1]}"
-            primary_unit = [unit for unit in units if unit.name == unit_name][0]
-            break
+            return units_by_name[f"{app_name}/{k.split('-')[-1]}"]
 
-    if not primary_unit:
-        raise ValueError("Unable to find primary unit")
-    return primary_unit
+    raise ValueError("Unable to find primary unit")
+
+
+# Cache for primary unit lookups—the get-cluster-status juju action takes several seconds
+# and the primary rarely changes within one retry burst
+_PRIMARY_UNIT_CACHE_TTL = 30  # seconds
+_primary_unit_cache: Dict[tuple, tuple] = {}
+
+
+def _invalidate_primary_unit_cache(ops_test: OpsTest, app_name: str) -> None:
+    """Drop the cached primary for an application (e.g. after a failover was observed).
+
+    Args:
+        ops_test: The ops test object passed into every test case
+        app_name: The name of the application
+    """
+    _primary_unit_cache.pop((ops_test.model.info.name, app_name), None)
 
 
 async def get_primary_unit_wrapper(ops_test: OpsTest, app_name: str, unit_excluded=None) -> Unit:
@@ -512,6 +707,13 @@ async def get_primary_unit_wrapper(ops_test: OpsTest, app_name: str, unit_exclud
     Returns:
         The primary Unit object
     """
+    # skip the cache when a unit is excluded—the cached primary may be the excluded unit
+    cache_key = (ops_test.model.info.name, app_name)
+    if not unit_excluded:
+        cached = _primary_unit_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < _PRIMARY_UNIT_CACHE_TTL:
+            return cached[1]
+
     logger.info("Retrieving primary unit")
     units = ops_test.model.applications[app_name].units
     if unit_excluded:
@@ -522,6 +724,8 @@ async def get_primary_unit_wrapper(ops_test: OpsTest, app_name: str, unit_exclud
         unit = units[0]
 
     primary_unit = await get_primary_unit(ops_test, unit, app_name)
+    if not unit_excluded:
+        _primary_unit_cache[cache_key] = (time.monotonic(), primary_unit)
 
     return primary_unit
 
@@ -571,46 +775,71 @@ async def ensure_all_units_continuous_writes_incrementing(
 
     server_config_credentials = await get_server_config_credentials(mysql_units[0])
 
-    last_max_written_value = await get_max_written_value_in_database(
-        ops_test, primary, server_config_credentials
-    )
+    try:
+        last_max_written_value = await get_max_written_value_in_database(
+            ops_test, primary, server_config_credentials
+        )
+    except (DatabaseError, InterfaceError, OperationalError, ProgrammingError):
+        # the cached primary may be stale after a failover—drop it and look up again
+        _invalidate_primary_unit_cache(ops_test, mysql_application_name)
+        primary = await get_primary_unit_wrapper(ops_test, mysql_application_name)
+        last_max_written_value = await get_max_written_value_in_database(
+            ops_test, primary, server_config_credentials
+        )
 
-    select_all_continuous_writes_sql = [
-        f"SELECT * FROM `{CONTINUOUS_WRITES_DATABASE_NAME}`.`{CONTINUOUS_WRITES_TABLE_NAME}`"
+    # issued as a prepared statement so the server caches the parse/plan across attempts on
+    # the pooled connection; the gap check runs server-side so only two aggregates cross
+    # the wire instead of the full continuous-writes table. Both aggregates are computed in
+    # a single statement so they share one consistent snapshot—with continuous writes
+    # actively inserting, separate statements would see different MAX values and fail (or
+    # pass) spuriously.
+    continuous_writes_table = (
+        f"`{CONTINUOUS_WRITES_DATABASE_NAME}`.`{CONTINUOUS_WRITES_TABLE_NAME}`"
+    )
+    select_continuous_writes_stats_sql = [
+        (
+            f"SELECT (SELECT MAX(number) FROM {continuous_writes_table}), "
+            f"(SELECT COUNT(DISTINCT number) FROM {continuous_writes_table} "
+            f"WHERE number BETWEEN %s AND (SELECT MAX(number) FROM {continuous_writes_table}) - 1)",
+            (1,),
+        ),
     ]
 
+    async def _verify_unit(unit: Unit) -> None:
+        unit_last_max_written_value = last_max_written_value
+
+        # unit addresses are stable across a test—resolve once per unit instead of on
+        # every retry attempt
+        unit_address = await get_unit_address(ops_test, unit.name)
+
+        async for attempt in tenacity.AsyncRetrying(
+            reraise=True, stop=tenacity.stop_after_delay(5 * 60), wait=tenacity.wait_fixed(10)
+        ):
+            with attempt:
+                # ensure that all units are up to date (including the previous primary)
+                max_written_value, distinct_count_below_max = await execute_queries_against_unit(
+                    unit_address,
+                    server_config_credentials["username"],
+                    server_config_credentials["password"],
+                    select_continuous_writes_stats_sql,
+                )
+
+                # ensure the max written value is incrementing (continuous writes is active)
+                assert (
+                    max_written_value > unit_last_max_written_value
+                ), "Continuous writes not incrementing"
+
+                # ensure that the unit contains all values up to the max written value
+                assert (
+                    distinct_count_below_max == max_written_value - 1
+                ), f"Missing numbers in database for unit {unit.name}"
+
+                unit_last_max_written_value = max_written_value
+
     async with ops_test.fast_forward():
-        for unit in mysql_units:
-            for attempt in tenacity.Retrying(
-                reraise=True, stop=tenacity.stop_after_delay(5 * 60), wait=tenacity.wait_fixed(10)
-            ):
-                with attempt:
-                    # ensure that all units are up to date (including the previous primary)
-                    unit_address = await get_unit_address(ops_test, unit.name)
-
-                    # ensure the max written value is incrementing (continuous writes is active)
-                    max_written_value = await get_max_written_value_in_database(
-                        ops_test, unit, server_config_credentials
-                    )
-                    assert (
-                        max_written_value > last_max_written_value
-                    ), "Continuous writes not incrementing"
-
-                    # ensure that the unit contains all values up to the max written value
-                    all_written_values = set(
-                        await execute_queries_against_unit(
-                            unit_address,
-                            server_config_credentials["username"],
-                            server_config_credentials["password"],
-                            select_all_continuous_writes_sql,
-                        )
-                    )
-                    numbers = set(range(1, max_written_value))
-                    assert (
-                        numbers <= all_written_values
-                    ), f"Missing numbers in database for unit {unit.name}"
-
-                    last_max_written_value = max_written_value
+        # verify all units concurrently—wall time is bounded by the slowest unit instead of
+        # the sum of every unit's retry loop
+        await asyncio.gather(*(_verify_unit(unit) for unit in mysql_units))
 
 
 async def get_workload_version(ops_test: OpsTest, unit_name: str) -> str:
@@ -637,21 +866,25 @@ async def get_leader_unit(
         app_name: The name of the application
         model: The model to use (overrides ops_test.model)
     """
-    leader_unit = None
     if not model:
         model = ops_test.model
-    for unit in model.applications[app_name].units:
-        if await unit.is_leader_from_status():
-            leader_unit = unit
-            break
 
-    return leader_unit
+    # probe all units concurrently—the serialized juju RPCs dominate for larger applications
+    units = model.applications[app_name].units
+    leader_flags = await asyncio.gather(*(unit.is_leader_from_status() for unit in units))
+    return next((unit for unit, is_leader in zip(units, leader_flags) if is_leader), None)
 
 
-def get_juju_status(model_name: str) -> str:
+async def get_juju_status(model_name: str) -> str:
     """Return the juju status output.
 
     Args:
         model_name: The model for which to retrieve juju status for
     """
-    return subprocess.check_output(["juju", "status", "--model", model_name]).decode("utf-8")
+    async with _subprocess_semaphore:
+        process = await asyncio.create_subprocess_exec(
+            "juju", "status", "--model", model_name, stdout=asyncio.subprocess.PIPE
+        )
+        raw_output, _ = await process.communicate()
+    assert process.returncode == 0, f"failed to get juju status for {model_name=}"
+    return raw_output.decode("utf-8")
@@ -123,7 +123,7 @@ async def test_upgrade_from_edge(ops_test: OpsTest, charm) -> None:
         wait=tenacity.wait_fixed(10),
     ):
         with attempt:
-            assert "+testupgrade" in get_juju_status(
+            assert "+testupgrade" in await get_juju_status(
                 ops_test.model.name
             ), "None of the units are upgraded"
 
@@ -181,7 +181,7 @@ async def test_fail_and_rollback(ops_test: OpsTest, charm, continuous_writes) ->
         wait=tenacity.wait_fixed(10),
     ):
         with attempt:
-            assert "Upgrade incompatible" in get_juju_status(
+            assert "Upgrade incompatible" in await get_juju_status(
                 ops_test.model.name
             ), "mysql router application status not indicating faulty charm incompatible"
 